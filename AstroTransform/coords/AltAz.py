@@ -2,85 +2,241 @@
 convert target to alt az
 """
 
+import math
 import numpy as np
-from datetime import datetime, timedelta
-from AstroTransform.time import JD, lst
+from datetime import datetime
+from AstroTransform.time import lst
 from AstroTransform.coords import hour_angle
 from astropy.time import Time
 
-def to_alt_az(RA, DEC, Lat, Lon, obs_time, time_zone=0):
+try:
+    from AstroTransform.coords._altaz_kernel import _altaz
+except ImportError:
+    # numba is optional, fall back to numpy ufuncs without it
+    _altaz = None
+
+# conversion factors to radians, 15 degrees per hour
+HOURS_TO_RAD = np.pi/12.0
+DEG_TO_RAD = np.pi/180.0
+
+# LST of the last array of observation times, so calls for new targets
+# on the same time grid skip the LST calculation
+_lst_cache = {}
+
+def to_alt_az(RA, DEC, Lat, Lon, obs_time, time_zone=0, dtype=np.float64):
     """
     Convert a target's RA and DEC to Altitude and Azimuth.
     
     Parameters
     ----------
-    RA : float
+    RA : float or numpy.ndarray
         The right ascension of the target in hours.
-    DEC : float
+    DEC : float or numpy.ndarray
         The declination of the target in degrees.
-    Lat : float
+    Lat : float or numpy.ndarray
         The latitude of the observer in degrees.
-    Lon : float
+    Lon : float or numpy.ndarray
         The longitude of the observer in degrees.
-    obs_time : datetime.datetime
-        The local time of the observation
+    obs_time : datetime.datetime or array_like of datetime.datetime
+        The local time of the observation, an array of times gives the
+        positions at each time.
+    time_zone : float, optional
+        The offset of local time from UT in hours.
+    dtype : numpy.dtype, optional
+        Float type the trigonometry is done in for array inputs, float32
+        halves the memory traffic of large batches at ~1e-4 degree
+        precision. The LST is always calculated in float64.
     
     Returns
     -------
-    float
+    float or numpy.ndarray
         The altitude of the target in degrees.
-    float
+    float or numpy.ndarray
         The azimuth of the target in degrees.
+
+    For array inputs the altitude and azimuth are returned as the two
+    rows of a single C-contiguous (2, ...) array, which unpacks into
+    alt, az views without a copy.
         
     """
+    RA = _as_float(RA)
+    DEC = _as_float(DEC)
+    Lat = _as_float(Lat)
+    Lon = _as_float(Lon)
+    obs_time = _as_time(obs_time)
+
+    #calculate LST, once per observation time and longitude before
+    #anything is broadcast against the targets
+    LST = _lst(obs_time, Lon, time_zone)
+
+    #precompute the latitude terms
+    if np.isscalar(Lat):
+        Lat_rad = Lat*DEG_TO_RAD
+        sinLat = math.sin(Lat_rad)
+        cosLat = math.cos(Lat_rad)
+    else:
+        Lat_rad = Lat*DEG_TO_RAD
+        sinLat = np.sin(Lat_rad)
+        cosLat = np.cos(Lat_rad)
+
+    return _alt_az(RA, DEC, sinLat, cosLat, LST, dtype)
+
+def make_alt_az(Lat, Lon, time_zone=0, dtype=np.float64):
+    """
+    Make a to_alt_az function specialised for a fixed observer.
+
+    The latitude terms are computed once here rather than on every call,
+    which helps when many targets or times are reduced for the same site.
+
+    Parameters
+    ----------
+    Lat : float
+        The latitude of the observer in degrees.
+    Lon : float
+        The longitude of the observer in degrees.
+    time_zone : float, optional
+        The offset of local time from UT in hours.
+    dtype : numpy.dtype, optional
+        Float type the trigonometry is done in for array inputs.
+
+    Returns
+    -------
+    callable
+        A function alt_az(RA, DEC, obs_time) taking the same RA, DEC and
+        obs_time as to_alt_az and returning the altitude and azimuth of
+        the target in degrees.
+    """
+    Lat = float(Lat)
+    Lon = float(Lon)
+
+    Lat_rad = Lat*DEG_TO_RAD
+    sinLat = math.sin(Lat_rad)
+    cosLat = math.cos(Lat_rad)
+
+    def alt_az(RA, DEC, obs_time):
+        LST = _lst(_as_time(obs_time), Lon, time_zone)
+        return _alt_az(_as_float(RA), _as_float(DEC), sinLat, cosLat, LST, dtype)
+
+    return alt_az
+
+def _as_float(x):
+    """
+    Coerce a scalar to a float and anything else to a float64 array.
+    """
+    if x is None:
+        raise TypeError("Expected a float or an array of floats, got None.")
+    if np.isscalar(x):
+        return float(x)
+    return np.asarray(x, dtype=np.float64)
+
+def _as_time(obs_time):
+    """
+    Coerce anything other than a single datetime to a datetime64 array.
+
+    A single datetime is kept for the plain python scalar path, arrays
+    never go through object dtype.
+    """
+    if obs_time is None:
+        raise TypeError("Expected a datetime.datetime object or an array of them for 'obs_time'.")
     if isinstance(obs_time, Time):
-        obs_time = obs_time.to_datetime()
-    if not isinstance(RA, (int, float)):
-        raise TypeError("Expected a float or int for 'RA'.")
-    if not isinstance(DEC, (int, float)):
-        raise TypeError("Expected a float or int for 'DEC'.")
-    if not isinstance(Lat, (int, float)):
-        raise TypeError("Expected a float or int for 'Lat'.")
-    if not isinstance(Lon, (int, float)):
-        raise TypeError("Expected a float or int for 'Lon'.")
-    if not isinstance(obs_time, datetime):
-        raise TypeError("Expected a datetime.datetime object for 'obs_time'.")
+        if obs_time.isscalar:
+            return obs_time.to_datetime()
+        # typed array directly rather than an object array of datetimes
+        obs_time = obs_time.datetime64
+    if isinstance(obs_time, datetime):
+        return obs_time
+    return np.asarray(lst._naive_utc(obs_time), dtype='datetime64[us]')
 
-    #convert to radians
-    RA_rad = np.deg2rad(RA * 15.0)
-    DEC_rad = np.deg2rad(DEC)
-    Lat_rad = np.deg2rad(Lat)
-    Lon_rad = np.deg2rad(Lon)
+def _lst(obs_time, Lon, time_zone):
+    """
+    Calculate the LST, reusing the previous result when called again
+    with the same array of observation times, longitudes and time zones.
+    """
+    if isinstance(obs_time, datetime):
+        return lst.lst(obs_time, Lon, time_zone)
 
-    #calculate LST
-    LST = lst.lst(obs_time, Lon, time_zone)
-    
+    key = tuple((a.dtype.str, a.shape, a.tobytes())
+                for a in (obs_time, np.asarray(Lon), np.asarray(time_zone)))
+    LST = _lst_cache.get(key)
+    if LST is None:
+        LST = lst.lst(obs_time, Lon, time_zone)
+        if isinstance(LST, np.ndarray):
+            # shared between calls, so must not be modified by the caller
+            LST.flags.writeable = False
+        _lst_cache.clear()
+        _lst_cache[key] = LST
+    return LST
+
+def _alt_az(RA, DEC, sinLat, cosLat, LST, dtype=np.float64):
+    """
+    Calculate Altitude and Azimuth in degrees from the RA and DEC of the
+    target, the sine and cosine of the observer's latitude and the local
+    sidereal time, doing the array trigonometry in dtype.
+    """
     #calculate hour angle
     HA = hour_angle.hourangle(LST, RA)
-    HA_rad = np.deg2rad(HA*15.0)
-    LSTrad = np.deg2rad(LST*15.0)
-    # calculate altitude
-    sin_alt = np.sin(DEC_rad)*np.sin(Lat_rad) + np.cos(DEC_rad)*np.cos(Lat_rad)*np.cos(HA_rad)
-    alt = np.arcsin(sin_alt)
-    #calculate azimuth #
-    tolerance = 1e-6
-    cos_az = (np.sin(DEC_rad) - np.sin(alt)*np.sin(Lat_rad))/(np.cos(alt)*np.cos(Lat_rad))
-    if not -1 - tolerance <= cos_az <= 1 + tolerance:
-        # Log a warning or raise an error
-        print(f"Warning: cos_az value {cos_az} is significantly out of range.")
-    cos_az = np.clip(cos_az, -1.0, 1.0)
-    az = np.arccos(cos_az)
-
-    if np.sin(HA_rad) > 0:
-        az = 2*np.pi - az
-    else:
-        az = az
-    #convert to degrees
-    alt = np.rad2deg(alt)
-    az = np.rad2deg(az)
 
+    if np.isscalar(HA) and np.isscalar(DEC) and np.isscalar(sinLat):
+        # the math module avoids the numpy overhead for a single target
+        DEC_rad = DEC*DEG_TO_RAD
+        HA_rad = HA*HOURS_TO_RAD
+        sinDec = math.sin(DEC_rad)
+        cosDec = math.cos(DEC_rad)
+        sinHA = math.sin(HA_rad)
+        cosHA = math.cos(HA_rad)
+        # calculate altitude, rounding can push the zenith past 1
+        sin_alt = sinDec*sinLat + cosDec*cosLat*cosHA
+        alt = math.asin(min(max(sin_alt, -1.0), 1.0))
+        #calculate azimuth, measured from north through east
+        az = math.atan2(-cosDec*sinHA, sinDec*cosLat - cosDec*sinLat*cosHA)
+        az = math.degrees(az) % 360.0
+        # a tiny negative azimuth wraps to exactly 360
+        if az >= 360.0:
+            az = 0.0
+        return math.degrees(alt), az
+
+    #convert to radians, the hour angle is wrapped so dtype is enough
+    DEC_rad = np.asarray(DEC*DEG_TO_RAD).astype(dtype, copy=False)
+    HA_rad = np.asarray(HA*HOURS_TO_RAD).astype(dtype, copy=False)
+    sinLat = np.asarray(sinLat).astype(dtype, copy=False)
+    cosLat = np.asarray(cosLat).astype(dtype, copy=False)
+
+    # altitude and azimuth share one C-contiguous (2, ...) array
+    shape = np.broadcast_shapes(DEC_rad.shape, sinLat.shape, cosLat.shape, HA_rad.shape)
+    out = np.empty((2,) + shape, dtype=dtype)
+
+    if _altaz is not None:
+        # fused single pass kernel for arrays of targets or times, this
+        # writes degrees directly
+        # copy broadcast inputs explicitly, ravel can hand back a broadcast
+        # view which numba warns about
+        DEC_rad, sinLat, cosLat, HA_rad = (
+            np.ascontiguousarray(x).reshape(-1) if x.shape == shape
+            else np.broadcast_to(x, shape).flatten()
+            for x in (DEC_rad, sinLat, cosLat, HA_rad))
+        _altaz(DEC_rad, sinLat, cosLat, HA_rad, out[0].reshape(-1), out[1].reshape(-1))
+    else:
+        # evaluate each sine and cosine once
+        sinDec = np.sin(DEC_rad)
+        cosDec = np.cos(DEC_rad)
+        sinHA = np.sin(HA_rad)
+        cosHA = np.cos(HA_rad)
+        # calculate altitude, accumulating in place in the output row
+        sin_alt = out[0]
+        np.multiply(cosDec, cosHA, out=sin_alt)
+        sin_alt *= cosLat
+        sin_alt += sinDec*sinLat
+        # rounding can push the zenith past 1
+        np.clip(sin_alt, -1.0, 1.0, out=sin_alt)
+        np.arcsin(sin_alt, out=sin_alt)
+        np.rad2deg(sin_alt, out=sin_alt)
+        #calculate azimuth, measured from north through east
+        az = np.rad2deg(np.arctan2(-cosDec*sinHA, sinDec*cosLat - cosDec*sinLat*cosHA))
+        np.mod(az, 360.0, out=out[1])
+        # a tiny negative azimuth wraps to exactly 360
+        np.copyto(out[1], 0.0, where=out[1] >= 360.0)
 
-    return alt, az
+    return out
 
 def max_alt(DEC, Lat):
     """
@@ -104,13 +260,13 @@ def max_alt(DEC, Lat):
         raise TypeError("Expected a float or int for 'Lat'.")
     #convert to radians
 
-    DEC_rad = np.deg2rad(DEC)
-    Lat_rad = np.deg2rad(Lat)
+    DEC_rad = DEC*DEG_TO_RAD
+    Lat_rad = Lat*DEG_TO_RAD
 
     
     #calculate hour angle
     HA = 0 # hour angle 0 when target transits
-    HA_rad = np.deg2rad(HA*15.0)
+    HA_rad = HA*HOURS_TO_RAD
 
     # calculate altitude
     sin_alt = np.sin(DEC_rad)*np.sin(Lat_rad) + np.cos(DEC_rad)*np.cos(Lat_rad)*np.cos(HA_rad)
@@ -0,0 +1,50 @@
+"""
+numba kernel for the alt az spherical trigonometry
+"""
+
+import math
+from numba import njit, prange
+
+
+@njit(parallel=True, fastmath={'contract', 'arcp', 'afn'}, cache=True)
+def _altaz(dec, sin_lat, cos_lat, ha, out_alt, out_az):
+    """
+    Calculate altitude and azimuth in a single pass over the inputs.
+
+    Parameters
+    ----------
+    dec : numpy.ndarray
+        The declination of the targets in radians.
+    sin_lat : numpy.ndarray
+        The sine of the latitude of the observer.
+    cos_lat : numpy.ndarray
+        The cosine of the latitude of the observer.
+    ha : numpy.ndarray
+        The hour angle of the targets in radians.
+    out_alt : numpy.ndarray
+        Array the altitude in degrees is written to.
+    out_az : numpy.ndarray
+        Array the azimuth in degrees is written to.
+    """
+    for i in prange(dec.shape[0]):
+        # sin and cos of the same argument side by side, with the afn flag
+        # LLVM lowers each pair to a single sincos call
+        sd, cd = math.sin(dec[i]), math.cos(dec[i])
+        sh, ch = math.sin(ha[i]), math.cos(ha[i])
+        sl, cl = sin_lat[i], cos_lat[i]
+
+        # calculate altitude, rounding can push the zenith past 1
+        sa = sd*sl + cd*cl*ch
+        if sa > 1.0:
+            sa = 1.0
+        elif sa < -1.0:
+            sa = -1.0
+        out_alt[i] = math.degrees(math.asin(sa))
+
+        # calculate azimuth, measured from north through east
+        az = math.degrees(math.atan2(-cd*sh, sd*cl - cd*sl*ch)) % 360.0
+        # a tiny negative azimuth wraps to exactly 360, check after the
+        # store since casting to float32 can round up to 360 as well
+        out_az[i] = az
+        if out_az[i] >= 360.0:
+            out_az[i] = 0.0
@@ -1,6 +1,4 @@
 import numpy as np
-from datetime import datetime, timedelta
-from AstroTransform.time import JD, lst
 
 """
 calculate hour angle
@@ -12,27 +10,27 @@ def hourangle(LST, RA):
 
     Parameters
     ----------
-    LST : float
+    LST : float or numpy.ndarray
         The local sidereal time in hours.
-    RA : float
+    RA : float or numpy.ndarray
         The right ascension of the object in hours.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The hour angle in hours.
     """
-    if not isinstance(LST, (int, float)):
-        raise TypeError("Expected a float or int for 'LST'.")
-    if not isinstance(RA, (int, float)):
-        raise TypeError("Expected a float or int for 'RA'.")
+    if not isinstance(LST, (int, float, np.ndarray)):
+        raise TypeError("Expected a float, int or numpy.ndarray for 'LST'.")
+    if not isinstance(RA, (int, float, np.ndarray)):
+        raise TypeError("Expected a float, int or numpy.ndarray for 'RA'.")
 
     HA = LST - RA
-    #normalise HA between -12 and 12
-    if HA > 12:
-        HA = HA - 24
-    elif HA < -12:
-        HA = HA + 24
+    #normalise HA between -12 and 12 by removing whole days
+    if isinstance(HA, np.ndarray):
+        HA = HA - 24.0*np.round(HA*(1.0/24.0))
+    else:
+        HA = HA - 24.0*round(HA*(1.0/24.0), 0)
 
     return HA
 
@@ -42,34 +40,28 @@ def ha_to_deg(HA):
 
     Parameters
     ----------
-    HA : float
+    HA : float or numpy.ndarray
         The hour angle in hours.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The hour angle in degrees.
     """
-    if not isinstance(HA, (int, float)):
-        raise TypeError("Expected a float or int for 'HA'.")
-
     return HA * 15.0
 
 def deg_to_ha(HA):
     """
-    Convert an hour angle to degrees.
+    Convert an hour angle in degrees to hours.
 
     Parameters
     ----------
-    HA : float
+    HA : float or numpy.ndarray
         The hour angle in degrees.
 
     Returns
     -------
-    float
+    float or numpy.ndarray
         The hour angle in hours.
     """
-    if not isinstance(HA, (int, float)):
-        raise TypeError("Expected a float or int for 'HA'.")
-
     return HA / 15.0
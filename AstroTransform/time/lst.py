@@ -3,8 +3,63 @@ Package for calculating Local Sidereal Time.
 """
 
 import numpy as np
-from datetime import datetime, timedelta
-from AstroTransform.time import JD
+from datetime import datetime, timedelta, timezone
+
+# 1st january 2000 at 12:00 UT
+J2000 = datetime(2000, 1, 1, 12, 0, 0)
+
+def _naive_utc(date_time):
+    """
+    Convert timezone aware datetime(s) to naive UTC, as numpy does when
+    casting them to datetime64, so scalar and array inputs agree.
+    """
+    if isinstance(date_time, datetime):
+        if date_time.tzinfo is None:
+            return date_time
+        return date_time.astimezone(timezone.utc).replace(tzinfo=None)
+
+    # only look at the first time, scanning every element costs more than
+    # the datetime64 cast itself
+    first = date_time
+    while isinstance(first, (list, tuple)) and first:
+        first = first[0]
+    if isinstance(first, np.ndarray):
+        first = first.flat[0] if first.dtype == object and first.size else None
+    if getattr(first, 'tzinfo', None) is None:
+        return date_time
+    return _naive_utc_ufunc(np.asarray(date_time, dtype=object))
+
+# elementwise version for object arrays of datetimes
+_naive_utc_ufunc = np.frompyfunc(
+    lambda d: _naive_utc(d) if isinstance(d, datetime) else d, 1, 1)
+
+def _utc_offset(time_zone):
+    """
+    Convert a time zone offset in hours to a timedelta64[us] array.
+    """
+    return (np.asarray(time_zone, dtype=np.float64)*3_600_000_000).astype('timedelta64[us]')
+
+def _gmst(D):
+    """
+    Calculate the Greenwich Mean Sidereal Time in hours from the number
+    of days since 1st january 2000 at 12:00 UT.
+    """
+    return (18.697374558 + (24.06570982441908 * D)) % 24
+
+def _days_since_j2000(date_time, time_zone):
+    """
+    Calculate the number of days since 1st january 2000 at 12:00 UT of
+    local time(s) in the given time zone.
+    """
+    date_time = _naive_utc(date_time)
+    if isinstance(date_time, datetime) and np.isscalar(time_zone):
+        # a single time is cheaper with plain python arithmetic
+        ut = local_to_ut(date_time, None, time_zone)
+        return (ut - J2000).total_seconds() / 86400
+
+    #convert to UT as datetime64, once for the whole array
+    ut = np.asarray(date_time, dtype='datetime64[us]') - _utc_offset(time_zone)
+    return (ut - np.datetime64(J2000)) / np.timedelta64(1, 'D')
 
 def local_to_ut(local_time, longitude, time_zone):
     """
@@ -12,26 +67,27 @@ def local_to_ut(local_time, longitude, time_zone):
 
     Parameters
     ----------
-    local_time : datetime.datetime
-        The local time to convert to Universal Time.
+    local_time : datetime.datetime or array_like
+        The local time(s) to convert to Universal Time.
     longitude : float
         The longitude of the observer in degrees.
+    time_zone : float or array_like
+        The offset of local time from UT in hours.
 
     Returns
     -------
-    datetime.datetime
-        The Universal Time.
+    datetime.datetime or numpy.ndarray
+        The Universal Time, as a datetime for a datetime input and a single
+        time zone, and as a datetime64[us] array otherwise.
     """
-    if not isinstance(local_time, datetime):
-        raise TypeError("Expected a datetime.datetime object for 'local_time'.")
-    if not isinstance(longitude, (int, float)):
-        raise TypeError("Expected a float or int for 'longitude'.")
+    local_time = _naive_utc(local_time)
 
-    # Calculate the offset in hours
-    offset = time_zone
+    # a single time is cheaper with plain datetime arithmetic
+    if isinstance(local_time, datetime) and np.isscalar(time_zone):
+        return local_time - timedelta(hours=time_zone)
 
     # Convert to UT
-    ut = local_time - timedelta(hours=offset)
+    ut = np.asarray(local_time, dtype='datetime64[us]') - _utc_offset(time_zone)
 
     return ut
 
@@ -41,27 +97,27 @@ def ut_to_local(ut, longitude, time_zone):
 
     Parameters
     ----------
-    ut : datetime.datetime
-        The Universal Time to convert to local time.  
+    ut : datetime.datetime or array_like
+        The Universal Time(s) to convert to local time.  
     longitude : float
         The longitude of the observer in degrees.
+    time_zone : float or array_like
+        The offset of local time from UT in hours.
     
     Returns
     -------
-    datetime.datetime
-        The local time.
+    datetime.datetime or numpy.ndarray
+        The local time, as a datetime for a datetime input and a single
+        time zone, and as a datetime64[us] array otherwise.
     """
+    ut = _naive_utc(ut)
 
-    if not isinstance(ut, datetime):
-        raise TypeError("Expected a datetime.datetime object for 'ut'.")
-    if not isinstance(longitude, (int, float)):
-        raise TypeError("Expected a float or int for 'longitude'.")
-
-    # Calculate the offset in hours
-    offset = time_zone
+    # a single time is cheaper with plain datetime arithmetic
+    if isinstance(ut, datetime) and np.isscalar(time_zone):
+        return ut + timedelta(hours=time_zone)
 
     # Convert to local time
-    local_time = ut + timedelta(hours=offset)
+    local_time = np.asarray(ut, dtype='datetime64[us]') + _utc_offset(time_zone)
 
     return local_time
 
@@ -71,40 +127,23 @@ def lst(date_time, longitude, time_zone=0):
 
     Parameters
     ----------
-    date_time : datetime.datetime
-        The datetime object to calculate the LST for.
-    longitude : float
+    date_time : datetime.datetime or array_like of datetime.datetime
+        The local time(s) to calculate the LST for.
+    longitude : float or array_like
         The longitude of the observer in degrees.
+    time_zone : float or array_like, optional
+        The offset of local time from UT in hours.
     
     Returns
     -------
-    float
+    float or numpy.ndarray
         The Local Sidereal Time in hours.
     """
 
-    #convert to UT
-    ut = local_to_ut(date_time, longitude, time_zone)
-
-    # Calculate the Julian Date
-    jd = JD.to_jd(ut)
-
     # calculate the number of days since 1st january 2000 at 12:00 UT
-    D = (jd - 2451545.0)
-
-    # calculate GMST
-    GMST = (18.697374558 + (24.06570982441908 * D)) % 24
-
-    # calculate LST
-    #if east of Greenwich, add longitude
-    if longitude > 0:
-        LST = (GMST + (longitude / 15))
-    #if west of Greenwich, subtract longitude
-    else:
-        LST = (GMST - (abs(longitude) / 15))
-
-    return LST
-
-
-
-
+    D = _days_since_j2000(date_time, time_zone)
 
+    # calculate LST, east of Greenwich is positive longitude
+    if np.isscalar(longitude):
+        return _gmst(D) + longitude / 15
+    return _gmst(D) + np.asarray(longitude, dtype=np.float64) / 15
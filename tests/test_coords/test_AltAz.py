@@ -0,0 +1,217 @@
+import pytest
+import numpy as np
+from datetime import datetime, timedelta
+from astropy.time import Time
+from AstroTransform.time import lst
+from AstroTransform.coords import AltAz
+
+# An observing site and time to work with as fixtures
+@pytest.fixture
+def site_data():
+    lat, lon = 28.7622, -17.8792
+    obs_time = datetime(2023, 9, 5, 23, 00, 00)
+    return lat, lon, obs_time
+
+def test_to_alt_az_transit(site_data):
+    lat, lon, obs_time = site_data
+    # a target on the meridian south of the zenith
+    RA = float(lst.lst(obs_time, lon))
+    alt, az = AltAz.to_alt_az(RA, 10.0, lat, lon, obs_time)
+    assert alt == pytest.approx(90.0 - (lat - 10.0), abs=1e-6)
+    assert az == pytest.approx(180.0, abs=1e-6)
+
+def test_to_alt_az_zenith_and_east(site_data):
+    lat, lon, obs_time = site_data
+    RA = float(lst.lst(obs_time, lon))
+    # a target through the zenith still has a finite azimuth
+    alt, az = AltAz.to_alt_az(RA, lat, lat, lon, obs_time)
+    assert alt == pytest.approx(90.0, abs=1e-6)
+    assert np.isfinite(az)
+    # a rising equatorial target is in the east
+    alt, az = AltAz.to_alt_az((RA + 3.0) % 24, 0.0, lat, lon, obs_time)
+    assert 0.0 < az < 180.0
+
+def test_to_alt_az_zenith_rounding(site_data, monkeypatch):
+    _, _, obs_time = site_data
+    # sin(alt) rounds to just above 1 for a zenith target at this latitude
+    lat = -87.843
+    RA = float(lst.lst(obs_time, 0.0))
+    alt, az = AltAz.to_alt_az(RA, lat, lat, 0.0, obs_time)
+    assert alt == pytest.approx(90.0)
+    for kernel in (AltAz._altaz, None):
+        monkeypatch.setattr(AltAz, "_altaz", kernel)
+        alt, az = AltAz.to_alt_az(np.full(3, RA), lat, lat, 0.0, obs_time)
+        assert alt == pytest.approx(90.0)
+
+def test_to_alt_az_array_matches_scalar(site_data):
+    lat, lon, obs_time = site_data
+    RA = np.linspace(0.5, 23.5, 17)
+    DEC = np.linspace(-60.0, 80.0, 17)
+    alt, az = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time)
+    assert alt.shape == az.shape == RA.shape
+    assert np.all((az >= 0.0) & (az < 360.0))
+    for i in range(RA.size):
+        expected_alt, expected_az = AltAz.to_alt_az(float(RA[i]), float(DEC[i]), lat, lon, obs_time)
+        assert alt[i] == pytest.approx(expected_alt, abs=1e-6)
+        assert az[i] == pytest.approx(expected_az, abs=1e-6)
+
+def test_to_alt_az_time_array(site_data):
+    lat, lon, obs_time = site_data
+    obs_times = [obs_time + timedelta(minutes=10*i) for i in range(12)]
+    alt, az = AltAz.to_alt_az(5.5, 20.0, lat, lon, obs_times)
+    assert alt.shape == az.shape == (12,)
+    for i, t in enumerate(obs_times):
+        expected_alt, expected_az = AltAz.to_alt_az(5.5, 20.0, lat, lon, t)
+        assert alt[i] == pytest.approx(expected_alt, abs=1e-6)
+        assert az[i] == pytest.approx(expected_az, abs=1e-6)
+
+@pytest.mark.filterwarnings("error::FutureWarning")
+def test_to_alt_az_single_element(site_data):
+    lat, lon, obs_time = site_data
+    expected = AltAz.to_alt_az(5.0, 20.0, lat, lon, obs_time)
+    # length one inputs broadcast to stride zero views
+    for out in (AltAz.to_alt_az(np.array([5.0]), 20.0, lat, lon, obs_time),
+                AltAz.to_alt_az(5.0, 20.0, lat, lon, [obs_time])):
+        assert out.shape == (2, 1)
+        assert out[:, 0] == pytest.approx(expected, abs=1e-6)
+
+def test_to_alt_az_stacked_output(site_data, monkeypatch):
+    lat, lon, obs_time = site_data
+    RA = np.linspace(0.5, 23.5, 17)
+    DEC = np.linspace(-60.0, 80.0, 17)
+    for kernel in (AltAz._altaz, None):
+        monkeypatch.setattr(AltAz, "_altaz", kernel)
+        out = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time)
+        assert out.shape == (2, 17)
+        assert out.flags.c_contiguous
+        alt, az = out
+        assert np.shares_memory(alt, out) and np.shares_memory(az, out)
+
+def test_to_alt_az_nan_propagation(site_data, monkeypatch):
+    lat, lon, obs_time = site_data
+    RA = np.array([5.0, np.nan, 5.0])
+    DEC = np.array([10.0, 10.0, np.nan])
+    for kernel in (AltAz._altaz, None):
+        monkeypatch.setattr(AltAz, "_altaz", kernel)
+        alt, az = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time)
+        assert np.isfinite(alt[0]) and np.isfinite(az[0])
+        assert np.all(np.isnan(alt[1:])) and np.all(np.isnan(az[1:]))
+
+def test_to_alt_az_observer_array(site_data):
+    lat, lon, obs_time = site_data
+    Lat = np.array([lat, -33.9, 51.5])
+    Lon = np.array([lon, 18.4, -0.1])
+    alt, az = AltAz.to_alt_az(5.5, 20.0, Lat, Lon, obs_time)
+    assert alt.shape == az.shape == (3,)
+    for i in range(Lat.size):
+        expected_alt, expected_az = AltAz.to_alt_az(5.5, 20.0, float(Lat[i]), float(Lon[i]), obs_time)
+        assert alt[i] == pytest.approx(expected_alt, abs=1e-6)
+        assert az[i] == pytest.approx(expected_az, abs=1e-6)
+
+def test_to_alt_az_float32(site_data, monkeypatch):
+    lat, lon, obs_time = site_data
+    RA = np.linspace(0.5, 23.5, 101)
+    DEC = np.linspace(-60.0, 80.0, 101)
+    alt, az = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time)
+    for kernel in (AltAz._altaz, None):
+        monkeypatch.setattr(AltAz, "_altaz", kernel)
+        alt32, az32 = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time, dtype=np.float32)
+        assert alt32.dtype == az32.dtype == np.float32
+        # 3e-6 rad, compare azimuths across the 0/360 wrap
+        assert np.all(np.abs(alt32 - alt) < np.rad2deg(3e-6))
+        assert np.all(np.abs((az32 - az + 180.0) % 360.0 - 180.0) < np.rad2deg(3e-6))
+
+def test_to_alt_az_lst_cache(site_data):
+    lat, lon, obs_time = site_data
+    obs_times = [obs_time + timedelta(minutes=10*i) for i in range(12)]
+    AltAz.to_alt_az(5.5, 20.0, lat, lon, obs_times)
+    LST = next(iter(AltAz._lst_cache.values()))
+    # new targets on the same time grid reuse the LST
+    alt, az = AltAz.to_alt_az(7.0, -10.0, lat, lon, obs_times)
+    assert next(iter(AltAz._lst_cache.values())) is LST
+    assert alt[3] == pytest.approx(AltAz.to_alt_az(7.0, -10.0, lat, lon, obs_times[3])[0], abs=1e-6)
+    # a different site does not
+    AltAz.to_alt_az(7.0, -10.0, lat, lon + 1.0, obs_times)
+    assert next(iter(AltAz._lst_cache.values())) is not LST
+
+def test_to_alt_az_target_time_grid(site_data, monkeypatch):
+    lat, lon, obs_time = site_data
+    RA = np.linspace(0.5, 23.5, 5)
+    DEC = np.linspace(-30.0, 70.0, 5)
+    obs_times = np.array([obs_time + timedelta(hours=i) for i in range(4)], dtype='datetime64[us]')
+    for kernel in (AltAz._altaz, None):
+        monkeypatch.setattr(AltAz, "_altaz", kernel)
+        alt, az = AltAz.to_alt_az(RA[:, None], DEC[:, None], lat, lon, obs_times)
+        assert alt.shape == az.shape == (5, 4)
+        # the LST is only calculated once per time
+        assert next(iter(AltAz._lst_cache.values())).shape == (4,)
+        expected_alt, expected_az = AltAz.to_alt_az(RA[3], DEC[3], lat, lon, obs_times[2])
+        assert alt[3, 2] == pytest.approx(expected_alt, abs=1e-6)
+        assert az[3, 2] == pytest.approx(expected_az, abs=1e-6)
+
+def test_alt_az_azimuth_below_360(site_data, monkeypatch):
+    lat, lon, obs_time = site_data
+    sinLat, cosLat = np.sin(np.deg2rad(lat)), np.cos(np.deg2rad(lat))
+    # just past upper culmination north of the zenith, atan2 gives -0 + tiny
+    alt, az = AltAz._alt_az(0.0, 80.0, sinLat, cosLat, 1e-16)
+    assert 0.0 <= az < 360.0
+    for kernel in (AltAz._altaz, None):
+        monkeypatch.setattr(AltAz, "_altaz", kernel)
+        alt, az = AltAz._alt_az(np.zeros(3), 80.0, sinLat, cosLat, 1e-16)
+        assert np.all((az >= 0.0) & (az < 360.0))
+        # float32 rounds 359.9999997 up to 360
+        LST = lst.lst(obs_time, lon)
+        alt, az = AltAz.to_alt_az(np.full(4, LST - 1e-7), 80.0, lat, lon,
+                                  obs_time, dtype=np.float32)
+        assert np.all((az >= 0.0) & (az < 360.0))
+
+def test_to_alt_az_numpy_fallback(site_data, monkeypatch):
+    lat, lon, obs_time = site_data
+    RA = np.linspace(0.5, 23.5, 17)
+    DEC = np.linspace(-60.0, 80.0, 17)
+    alt, az = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time)
+    monkeypatch.setattr(AltAz, "_altaz", None)
+    fallback_alt, fallback_az = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time)
+    assert fallback_alt == pytest.approx(alt, abs=1e-6)
+    assert fallback_az == pytest.approx(az, abs=1e-6)
+
+def test_make_alt_az_matches_to_alt_az(site_data):
+    lat, lon, obs_time = site_data
+    alt_az = AltAz.make_alt_az(lat, lon, time_zone=1)
+    RA = np.linspace(0.5, 23.5, 5)
+    DEC = np.linspace(-30.0, 70.0, 5)
+    alt, az = alt_az(RA, DEC, obs_time)
+    expected_alt, expected_az = AltAz.to_alt_az(RA, DEC, lat, lon, obs_time, time_zone=1)
+    assert alt == pytest.approx(expected_alt, abs=1e-9)
+    assert az == pytest.approx(expected_az, abs=1e-9)
+    assert alt_az(2.0, 45.0, obs_time) == pytest.approx(
+        AltAz.to_alt_az(2.0, 45.0, lat, lon, obs_time, time_zone=1), abs=1e-9)
+
+def test_to_alt_az_numpy_types(site_data):
+    lat, lon, obs_time = site_data
+    alt, az = AltAz.to_alt_az(np.float32(5.5), np.int64(20), np.float64(lat), lon,
+                              np.datetime64(obs_time))
+    expected_alt, expected_az = AltAz.to_alt_az(5.5, 20.0, lat, lon, obs_time)
+    assert alt == pytest.approx(expected_alt, abs=1e-6)
+    assert az == pytest.approx(expected_az, abs=1e-6)
+
+def test_to_alt_az_astropy_time(site_data):
+    lat, lon, obs_time = site_data
+    obs_times = [obs_time + timedelta(minutes=10*i) for i in range(12)]
+    alt, az = AltAz.to_alt_az(5.5, 20.0, lat, lon, Time(obs_times))
+    expected_alt, expected_az = AltAz.to_alt_az(5.5, 20.0, lat, lon, obs_times)
+    assert alt == pytest.approx(expected_alt, abs=1e-6)
+    assert az == pytest.approx(expected_az, abs=1e-6)
+    assert AltAz.to_alt_az(5.5, 20.0, lat, lon, Time(obs_time)) == pytest.approx(
+        AltAz.to_alt_az(5.5, 20.0, lat, lon, obs_time), abs=1e-6)
+
+def test_to_alt_az_invalid_type(site_data):
+    lat, lon, obs_time = site_data
+    with pytest.raises(ValueError):
+        AltAz.to_alt_az(10.0, 10.0, lat, lon, "invalid")
+    with pytest.raises(ValueError):
+        AltAz.to_alt_az("invalid", 10.0, lat, lon, obs_time)
+    with pytest.raises(TypeError):
+        AltAz.to_alt_az(10.0, 10.0, lat, lon, None)
+    with pytest.raises(TypeError):
+        AltAz.to_alt_az(None, 10.0, lat, lon, obs_time)
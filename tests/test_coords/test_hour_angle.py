@@ -0,0 +1,35 @@
+import pytest
+import numpy as np
+from AstroTransform.coords import hour_angle
+
+def test_hourangle_scalar():
+    assert hour_angle.hourangle(20.0, 2.0) == pytest.approx(-6.0)
+    assert hour_angle.hourangle(2.0, 20.0) == pytest.approx(6.0)
+    assert hour_angle.hourangle(5.0, 3.5) == pytest.approx(1.5)
+    assert np.isnan(hour_angle.hourangle(float('nan'), 3.5))
+
+def test_hourangle_range():
+    LST = np.linspace(-36.0, 48.0, 1001)
+    HA = hour_angle.hourangle(LST, 1.25)
+    assert np.all(HA >= -12.0)
+    assert np.all(HA <= 12.0)
+    # only whole days are removed
+    remainder = (LST - 1.25 - HA) / 24.0
+    assert remainder == pytest.approx(np.round(remainder))
+
+def test_hourangle_array_matches_scalar():
+    LST = np.array([0.5, 11.0, 23.9, 30.0])
+    RA = np.array([23.0, 0.0, 1.0, 2.0])
+    HA = hour_angle.hourangle(LST, RA)
+    for i in range(LST.size):
+        assert HA[i] == pytest.approx(hour_angle.hourangle(float(LST[i]), float(RA[i])))
+
+def test_hourangle_invalid_type():
+    with pytest.raises(TypeError):
+        hour_angle.hourangle("invalid", 1.0)
+
+def test_ha_deg_conversion():
+    assert hour_angle.ha_to_deg(-2.5) == pytest.approx(-37.5)
+    assert hour_angle.deg_to_ha(-37.5) == pytest.approx(-2.5)
+    HA = np.array([-12.0, 0.0, 6.5])
+    assert hour_angle.deg_to_ha(hour_angle.ha_to_deg(HA)) == pytest.approx(HA)
@@ -0,0 +1,75 @@
+import pytest
+import warnings
+import numpy as np
+from datetime import datetime, timedelta, timezone
+from AstroTransform.time import JD, lst
+
+# Some times and a site to work with as fixtures
+@pytest.fixture
+def lst_data():
+    dts = [datetime(2023, 9, 5, 14, 00, 00), datetime(2023, 9, 6, 2, 30, 00)]
+    lon = -17.8792
+    return dts, lon
+
+def expected_lst(dt, lon):
+    D = JD.to_jd(dt) - 2451545.0
+    return (18.697374558 + 24.06570982441908 * D) % 24 + lon / 15
+
+def test_lst_scalar(lst_data):
+    dts, lon = lst_data
+    calculated_lst = lst.lst(dts[0], lon)
+    assert calculated_lst == pytest.approx(expected_lst(dts[0], lon), abs=1e-6)
+
+def test_lst_array(lst_data):
+    dts, lon = lst_data
+    calculated_lst = lst.lst(dts, lon)
+    assert calculated_lst.shape == (2,)
+    for dt, value in zip(dts, calculated_lst):
+        assert value == pytest.approx(expected_lst(dt, lon), abs=1e-6)
+
+def test_lst_time_zone(lst_data):
+    dts, lon = lst_data
+    # 15:00 at UT+1 is 14:00 UT
+    calculated_lst = lst.lst(datetime(2023, 9, 5, 15, 00, 00), lon, time_zone=1)
+    assert calculated_lst == pytest.approx(expected_lst(dts[0], lon), abs=1e-6)
+
+def test_lst_j2000():
+    # GMST at the J2000.0 epoch
+    assert lst.lst(datetime(2000, 1, 1, 12, 00, 00), 0) == pytest.approx(18.697374558)
+
+def test_local_to_ut_scalar():
+    ut = lst.local_to_ut(datetime(2023, 9, 5, 15, 30, 00), 0, 1.5)
+    assert ut == datetime(2023, 9, 5, 14, 00, 00)
+
+def test_local_to_ut_array(lst_data):
+    dts, lon = lst_data
+    ut = lst.local_to_ut(dts, lon, np.array([1, -2]))
+    assert ut.dtype == np.dtype('datetime64[us]')
+    assert ut.tolist() == [datetime(2023, 9, 5, 13, 00, 00), datetime(2023, 9, 6, 4, 30, 00)]
+
+def test_local_to_ut_time_zone_array():
+    ut = lst.local_to_ut(datetime(2023, 9, 5, 15, 30, 00), 0, np.array([1.5, -2]))
+    assert ut.dtype == np.dtype('datetime64[us]')
+    assert ut.tolist() == [datetime(2023, 9, 5, 14, 00, 00), datetime(2023, 9, 5, 17, 30, 00)]
+
+def test_ut_to_local_roundtrip(lst_data):
+    dts, lon = lst_data
+    assert lst.ut_to_local(lst.local_to_ut(dts[0], lon, 5.5), lon, 5.5) == dts[0]
+
+def test_lst_nat(lst_data):
+    dts, lon = lst_data
+    times = np.array([dts[0], 'NaT'], dtype='datetime64[us]')
+    calculated_lst = lst.lst(times, lon)
+    assert calculated_lst[0] == pytest.approx(expected_lst(dts[0], lon), abs=1e-6)
+    assert np.isnan(calculated_lst[1])
+
+def test_lst_timezone_aware(lst_data):
+    dts, lon = lst_data
+    # 16:00 at UTC+2 is 14:00 UTC, the same instant as dts[0]
+    aware = datetime(2023, 9, 5, 16, 00, 00, tzinfo=timezone(timedelta(hours=2)))
+    expected = lst.lst(dts[0], lon)
+    assert lst.lst(aware, lon) == pytest.approx(expected, abs=1e-9)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        assert lst.lst([aware, aware], lon) == pytest.approx([expected, expected], abs=1e-9)
+    assert lst.local_to_ut(aware, lon, 0) == dts[0]